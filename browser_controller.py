@@ -13,7 +13,7 @@ from playwright.async_api import async_playwright, TimeoutError as PlaywrightTim
 
 from config import Config
 from data_manager import DataManager
-from utils.network import is_connected
+from utils.network import wait_for_connection_async
 from utils import elapsed_timer
 from utils.human_typing import HumanTyping
 from utils.proxy_rotation import create_proxy_rotator_from_config
@@ -31,6 +31,7 @@ VIEWPORT_WIDTH_RANGE = (1366, 1920)
 VIEWPORT_HEIGHT_RANGE = (768, 1080)
 MAX_RETRY_ATTEMPTS = 3
 INITIAL_BACKOFF_SECONDS = 2
+POINTS_PATTERN = re.compile(r'\d+')
 
 class BrowserController:
     def __init__(self, config: Config, data_manager: DataManager, 
@@ -49,12 +50,19 @@ class BrowserController:
 
     def apply_runtime_config(self, reset_browser: bool = True):
         """Apply in-memory config updates without requiring app restart."""
-        self.human_typer = HumanTyping(
-            mistake_probability=self.config.mistake_probability if self.config.simulate_mistakes else 0.0,
-            char_delay_ms=(50, 200) if self.config.typing_speed_variance else (100, 120),
-            word_pause_ms=(100, 400),
-            correction_delay_ms=(200, 600)
-        )
+        mistake_probability = self.config.mistake_probability if self.config.simulate_mistakes else 0.0
+        char_delay_ms = (50, 200) if self.config.typing_speed_variance else (100, 120)
+        if getattr(self, 'human_typer', None) is None:
+            self.human_typer = HumanTyping(
+                mistake_probability=mistake_probability,
+                char_delay_ms=char_delay_ms,
+                word_pause_ms=(100, 400),
+                correction_delay_ms=(200, 600)
+            )
+        else:
+            # Reuse the existing typer; assigning the range properties updates it in place
+            self.human_typer.mistake_probability = mistake_probability
+            self.human_typer.char_delay_range = char_delay_ms
 
         self.random_mouse_movements = self.config.random_mouse_movements
 
@@ -74,8 +82,7 @@ class BrowserController:
         topic_generator_type = getattr(self.config, 'topic_generator_type', 'runtime').lower()
         if topic_generator_type == 'runtime' and not isinstance(self.topics_provider, RuntimeTopicGenerator):
             self.topics_provider = RuntimeTopicGenerator(config={
-                'cache_duplicates': True,
-                'max_generation_attempts': 10
+                'cache_duplicates': True
             })
             self.logger.info("Switched topic provider to RuntimeTopicGenerator")
         elif topic_generator_type != 'runtime' and not isinstance(self.topics_provider, DailyTopics):
@@ -259,26 +266,19 @@ class BrowserController:
         except Exception as e:
             self.logger.error(f"Error closing Playwright browser: {e}")
 
-    def _wait_for_connection(self, retry_seconds: int = 5) -> bool:
-        """Block until internet is available or stop_event is set. Returns True when connected, False if stopped."""
-        while not self.stop_event.is_set():
-            if is_connected():
-                self.logger.info("Network connectivity available.")
-                return True
-            self.logger.warning(f"No internet connectivity detected. Retrying in {retry_seconds} seconds...")
-            # Use stop_event.wait() instead of time.sleep() for better responsiveness
-            if self.stop_event.wait(timeout=retry_seconds):
-                break
-        self.logger.info("Stop requested while waiting for network; aborting wait.")
-        return False
+    async def _wait_for_connection(self, retry_seconds: int = 5) -> bool:
+        """Wait, off the event loop, until internet is available or stop_event is set. Returns True when connected, False if stopped."""
+        if self.stop_event.is_set():
+            return False
+        return await wait_for_connection_async(
+            retry_seconds=retry_seconds, logger=self.logger, stop_event=self.stop_event
+        )
 
     async def get_current_points(self):
         """Fetches the current rewards points from the rewards page."""
         try:
-            if not is_connected():
-                self.logger.warning("No internet connection detected. Waiting...")
-                if not self._wait_for_connection():
-                    return self.last_points
+            if not await self._wait_for_connection():
+                return self.last_points
             
             # Ensure browser is ready (creates new if closed)
             await self._ensure_browser_ready()
@@ -328,7 +328,7 @@ class BrowserController:
             self.logger.debug(f"Raw points text from {successful_selector}: '{points_text}'")
             
             # Extract FIRST number (matching reference implementation)
-            match = re.search(r'\d+', points_text)
+            match = POINTS_PATTERN.search(points_text)
             
             if match:
                 points = int(match.group())
@@ -358,10 +358,8 @@ class BrowserController:
             backoff_delay = INITIAL_BACKOFF_SECONDS * (2 ** attempt)  # Exponential: 2s, 4s, 8s
             
             try:
-                if not is_connected():
-                    self.logger.warning("No internet connection before search. Waiting...")
-                    if not self._wait_for_connection():
-                        return
+                if not await self._wait_for_connection():
+                    return
                 
                 # Ensure browser is ready before searching
                 await self._ensure_browser_ready()
@@ -481,7 +479,7 @@ class BrowserController:
                     self.gui.set_current_topic(term)
 
                 # Record search start time for metrics
-                search_start_time = time.time()
+                search_start_time = time.monotonic()
                 points_before_search = await self.get_current_points()
                 
                 try:
@@ -491,7 +489,7 @@ class BrowserController:
                     self.data_manager.add_search(term, current_points)
                     
                     # Calculate search duration and points gained
-                    search_duration_ms = (time.time() - search_start_time) * 1000
+                    search_duration_ms = (time.monotonic() - search_start_time) * 1000
                     points_gained = max(0, current_points - points_before_search)
                     
                     # Record successful search in metrics
@@ -3,10 +3,18 @@ from datetime import datetime
 import random
 import time
 import logging
-from utils.topic_provider import TopicProvider
+from typing import Dict, NamedTuple, Optional
 
 
-class DailyTopics(TopicProvider):
+class DailyTopicsStats(NamedTuple):
+    """Provider statistics returned by DailyTopics.get_statistics()."""
+    total_days: int
+    topics_per_day: Dict[str, int]
+    generator_type: str
+    current_day: Optional[str]
+
+
+class DailyTopics:
     def __init__(self):
         self.topics_by_day = {
             'Monday': [
@@ -83,9 +91,9 @@ class DailyTopics(TopicProvider):
 
     def get_statistics(self):
         """Get provider statistics (TopicProvider interface implementation)"""
-        return {
-            'total_days': len(self.topics_by_day),
-            'topics_per_day': {day: len(topics) for day, topics in self.topics_by_day.items()},
-            'generator_type': 'DailyTopics',
-            'current_day': self._current_day_key
-        }
+        return DailyTopicsStats(
+            total_days=len(self.topics_by_day),
+            topics_per_day={day: len(topics) for day, topics in self.topics_by_day.items()},
+            generator_type='DailyTopics',
+            current_day=self._current_day_key,
+        )
@@ -57,8 +57,7 @@ class Application:
         if topic_generator_type == 'runtime':
             provider = RuntimeTopicGenerator(
                 config={
-                    'cache_duplicates': True,
-                    'max_generation_attempts': 10
+                    'cache_duplicates': True
                 },
                 topics_logger=self.topics_logger
             )
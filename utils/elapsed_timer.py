@@ -2,46 +2,60 @@
 
 import time
 
-_start_time = None
-_paused_elapsed = None
-
-def start():
-    """Start the elapsed time timer."""
-    global _start_time, _paused_elapsed
-    _start_time = time.time()
-    _paused_elapsed = None
-
-def stop():
-    """Stop the timer and return elapsed time in seconds."""
-    global _start_time, _paused_elapsed
-    if _start_time is None:
-        return 0
-    elapsed = time.time() - _start_time
-    _start_time = None
-    _paused_elapsed = None
-    return elapsed
-
-def pause():
-    """Pause the timer and save elapsed time without resetting it."""
-    global _start_time, _paused_elapsed
-    if _start_time is None:
-        return _paused_elapsed if _paused_elapsed is not None else 0
-    _paused_elapsed = time.time() - _start_time
-    _start_time = None
-    return _paused_elapsed
-
-def reset():
-    """Reset the timer."""
-    global _start_time, _paused_elapsed
-    _start_time = None
-    _paused_elapsed = None
-
-def get_elapsed():
-    """Get the current elapsed time in seconds without stopping the timer.
-    If paused, returns the paused elapsed time."""
-    global _start_time, _paused_elapsed
-    if _paused_elapsed is not None:
-        return _paused_elapsed
-    if _start_time is None:
-        return 0
-    return time.time() - _start_time
+_now = time.monotonic  # Immune to wall-clock (NTP) adjustments
+
+
+class ElapsedTimer:
+    """Pausable elapsed time timer. Independent instances can time overlapping regions."""
+
+    __slots__ = ('_start_time', '_paused_elapsed')
+
+    def __init__(self):
+        self._start_time = None
+        self._paused_elapsed = None
+
+    def start(self):
+        """Start the elapsed time timer."""
+        self._start_time = _now()
+        self._paused_elapsed = None
+
+    def stop(self):
+        """Stop the timer and return elapsed time in seconds."""
+        if self._start_time is None:
+            return 0
+        elapsed = _now() - self._start_time
+        self._start_time = None
+        self._paused_elapsed = None
+        return elapsed
+
+    def pause(self):
+        """Pause the timer and save elapsed time without resetting it."""
+        if self._start_time is None:
+            return self._paused_elapsed if self._paused_elapsed is not None else 0
+        self._paused_elapsed = _now() - self._start_time
+        self._start_time = None
+        return self._paused_elapsed
+
+    def reset(self):
+        """Reset the timer."""
+        self._start_time = None
+        self._paused_elapsed = None
+
+    def get_elapsed(self):
+        """Get the current elapsed time in seconds without stopping the timer.
+        If paused, returns the paused elapsed time."""
+        if self._paused_elapsed is not None:
+            return self._paused_elapsed
+        if self._start_time is None:
+            return 0
+        return _now() - self._start_time
+
+
+# Module-level functions operate on a shared default timer (session timer)
+_default_timer = ElapsedTimer()
+
+start = _default_timer.start
+stop = _default_timer.stop
+pause = _default_timer.pause
+reset = _default_timer.reset
+get_elapsed = _default_timer.get_elapsed
@@ -41,6 +41,13 @@ TYPO_MAP = {
     'z': ['a', 's', 'x'],
 }
 
+# Flat lookup table indexed by ord(char) - ord('a'); avoids dict hashing per keystroke
+_TYPO_TABLE = [()] * 26
+for _key, _neighbors in TYPO_MAP.items():
+    _TYPO_TABLE[ord(_key) - 97] = tuple(_neighbors)
+_TYPO_TABLE = tuple(_TYPO_TABLE)
+del _key, _neighbors
+
 
 class HumanTyping:
     """Simulates realistic human typing with mistakes and corrections."""
@@ -61,31 +68,61 @@ class HumanTyping:
         self.char_delay_range = char_delay_ms
         self.word_pause_range = word_pause_ms
         self.logger = logging.getLogger(__name__)
+        self._rng = random.Random()
+    
+    # The (min, max) ranges are stored as separate low/high attributes so the
+    # per-keystroke delay draws avoid unpacking a tuple on every call.
+    @property
+    def char_delay_range(self) -> tuple:
+        return (self._char_lo, self._char_hi)
+    
+    @char_delay_range.setter
+    def char_delay_range(self, value: tuple) -> None:
+        self._char_lo, self._char_hi = value
+    
+    @property
+    def word_pause_range(self) -> tuple:
+        return (self._word_lo, self._word_hi)
+    
+    @word_pause_range.setter
+    def word_pause_range(self, value: tuple) -> None:
+        self._word_lo, self._word_hi = value
+    
+    @property
+    def correction_delay_range(self) -> tuple:
+        return (self._correction_lo, self._correction_hi)
+    
+    @correction_delay_range.setter
+    def correction_delay_range(self, value: tuple) -> None:
+        self._correction_lo, self._correction_hi = value
     
     def _should_make_mistake(self) -> bool:
         """Determine if a typo should be made."""
-        return random.random() < self.mistake_probability
+        return self._rng.random() < self.mistake_probability
     
     def _get_typo_char(self, char: str) -> str:
         """Get a realistic typo for a character."""
-        char_lower = char.lower()
-        if char_lower in TYPO_MAP and TYPO_MAP[char_lower]:
-            typo = random.choice(TYPO_MAP[char_lower])
+        lower = char.lower()
+        # lower() can return several characters (e.g. 'İ'), which have no typo entry
+        idx = ord(lower) - 97 if len(lower) == 1 else -1
+        neighbors = _TYPO_TABLE[idx] if 0 <= idx < 26 else ()
+        if neighbors:
+            typo = neighbors[self._rng.randrange(len(neighbors))]
             # Preserve case
             return typo.upper() if char.isupper() else typo
         return char
     
     def _get_char_delay(self) -> float:
         """Get random delay between characters in milliseconds."""
-        return random.uniform(*self.char_delay_range)
+        return self._char_lo + (self._char_hi - self._char_lo) * self._rng.random()
     
     def _get_word_pause(self) -> float:
         """Get random pause after word boundary in milliseconds."""
-        return random.uniform(*self.word_pause_range)
+        return self._word_lo + (self._word_hi - self._word_lo) * self._rng.random()
     
     def _get_correction_delay(self) -> float:
         """Get delay before correcting a mistake in milliseconds."""
-        return random.uniform(*self.correction_delay_range)
+        return self._correction_lo + (self._correction_hi - self._correction_lo) * self._rng.random()
     
     async def type_like_human(self, element: Locator, text: str, 
                              simulate_mistakes: bool = True) -> None:
@@ -97,18 +134,31 @@ class HumanTyping:
             text: Text to type
             simulate_mistakes: Whether to simulate typos and corrections
         """
-        self.logger.debug(f"Typing '{text}' with human-like behavior (mistakes={simulate_mistakes})")
+        self.logger.debug("Typing %r with human-like behavior (mistakes=%s)", text, simulate_mistakes)
         
         # Clear existing text
         await element.fill('')
-        
+
+        if not simulate_mistakes:
+            # No typos to interleave: send one word per call and let Playwright
+            # pace its keystrokes, keeping the pause after each space
+            *words, last = text.split(' ')
+            for word in words:
+                await element.type(word + ' ', delay=self._get_char_delay())
+                await asyncio.sleep(self._get_word_pause() / 1000)
+            if last:
+                await element.type(last, delay=self._get_char_delay())
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Completed typing %r with %d words", text, text.count(' ') + 1)
+            return
+
         for i, char in enumerate(text):
             # Determine if we should make a mistake
-            if simulate_mistakes and self._should_make_mistake() and char.isalpha():
+            if self._should_make_mistake() and char.isalpha():
                 # Type wrong character
                 typo = self._get_typo_char(char)
                 await element.type(typo, delay=self._get_char_delay())
-                self.logger.debug(f"Typo: typed '{typo}' instead of '{char}'")
+                self.logger.debug("Typo: typed %r instead of %r", typo, char)
                 
                 # Brief pause before noticing mistake
                 correction_delay = self._get_correction_delay()
@@ -116,25 +166,23 @@ class HumanTyping:
                 
                 # Delete the mistake (backspace)
                 await element.press('Backspace')
-                await asyncio.sleep(random.uniform(50, 150) / 1000)
+                await asyncio.sleep(self._rng.uniform(50, 150) / 1000)
                 
-                # Type correct character
-                await element.type(char, delay=self._get_char_delay())
-                self.logger.debug(f"Corrected to '{char}'")
+                # Type correct character (small inter-key jitter folded into the delay)
+                await element.type(char, delay=self._get_char_delay() + self._rng.uniform(10, 50))
+                self.logger.debug("Corrected to %r", char)
             else:
-                # Type normally
-                delay = self._get_char_delay()
+                # Type normally (small inter-key jitter folded into the delay)
+                delay = self._get_char_delay() + self._rng.uniform(10, 50)
                 await element.type(char, delay=delay)
-            
+
             # Extra pause after spaces (word boundaries)
             if char == ' ':
                 word_pause = self._get_word_pause()
                 await asyncio.sleep(word_pause / 1000)
-            
-            # Very small random pause between characters
-            await asyncio.sleep(random.uniform(10, 50) / 1000)
         
-        self.logger.info(f"Completed typing '{text}' with {text.count(' ') + 1} words")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Completed typing %r with %d words", text, text.count(' ') + 1)
     
     async def type_with_mistakes(self, page: Page, selector: str, text: str) -> None:
         """
@@ -1,11 +1,32 @@
 # utils/logger.py - Logging configuration
 
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+def _stop_listener():
+    """Stop the root logger's QueueListener, if any, and close its handlers."""
+    root_logger = logging.getLogger()
+    listener = getattr(root_logger, '_queue_listener', None)
+    if listener is None:
+        return
+    # Clear first so a repeated call (e.g. at exit) is a no-op
+    root_logger._queue_listener = None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
 
 def setup_logging(log_level='INFO', log_file=None, log_format=None):
-    """Configure logging for the application."""
+    """Configure logging for the application.
+
+    The root logger only gets a QueueHandler; the console and file handlers
+    are driven by a background QueueListener so log calls never block the
+    calling thread (including the Playwright event loop) on disk I/O.
+    """
     if log_format is None:
         log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     
@@ -19,7 +40,7 @@ def setup_logging(log_level='INFO', log_file=None, log_format=None):
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler (if log_file is provided)
     if log_file:
@@ -28,7 +49,21 @@ def setup_logging(log_level='INFO', log_file=None, log_format=None):
             os.makedirs(log_dir, exist_ok=True)
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Tear down the queue from a previous setup_logging() call
+    _stop_listener()
+    for handler in [h for h in root_logger.handlers if isinstance(h, QueueHandler)]:
+        root_logger.removeHandler(handler)
+
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    root_logger._queue_listener = listener
+    # Flush queued records on interpreter exit (registered once across calls)
+    atexit.unregister(_stop_listener)
+    atexit.register(_stop_listener)
 
 
 def get_topics_logger(topics_log_file):
@@ -3,9 +3,12 @@
 
 import time
 import logging
-from typing import Dict, List, Optional
-from collections import defaultdict
+from typing import Dict, Optional
+from collections import Counter
 from dataclasses import dataclass, field
+from types import MappingProxyType
+
+_now = time.monotonic  # start_time is only ever compared against _now()
 
 
 @dataclass
@@ -15,19 +18,20 @@ class SearchMetrics:
     successful_searches: int = 0
     failed_searches: int = 0
     total_points_gained: int = 0
-    search_durations: List[float] = field(default_factory=list)
-    errors_by_type: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    # Running total of durations; successful_searches is the count
+    _duration_sum: float = field(default=0.0, init=False, repr=False)
+    errors_by_type: Dict[str, int] = field(default_factory=Counter)
     start_time: Optional[float] = None
     
     def record_search_start(self) -> float:
         """Record when a search starts and return the timestamp."""
-        return time.time()
+        return _now()
     
     def record_search_success(self, duration_seconds: float, points_gained: int) -> None:
         """Record a successful search."""
         self.total_searches += 1
         self.successful_searches += 1
-        self.search_durations.append(duration_seconds)
+        self._duration_sum += duration_seconds
         if points_gained > 0:
             self.total_points_gained += points_gained
     
@@ -39,9 +43,9 @@ class SearchMetrics:
     
     def get_average_search_duration(self) -> float:
         """Get average search duration in seconds."""
-        if not self.search_durations:
+        if self.successful_searches == 0:
             return 0.0
-        return sum(self.search_durations) / len(self.search_durations)
+        return self._duration_sum / self.successful_searches
     
     def get_success_rate(self) -> float:
         """Get success rate as a percentage."""
@@ -53,7 +57,7 @@ class SearchMetrics:
         """Calculate searches per minute since start."""
         if not self.start_time or self.total_searches == 0:
             return 0.0
-        elapsed_minutes = (time.time() - self.start_time) / 60
+        elapsed_minutes = (_now() - self.start_time) / 60
         if elapsed_minutes == 0:
             return 0.0
         return self.total_searches / elapsed_minutes
@@ -74,7 +78,7 @@ class SearchMetrics:
             return None
         
         points_needed = target_points - current_points
-        elapsed_seconds = time.time() - self.start_time
+        elapsed_seconds = _now() - self.start_time
         
         if elapsed_seconds == 0 or self.total_points_gained == 0:
             return None
@@ -86,7 +90,11 @@ class SearchMetrics:
         return points_needed / points_per_second
     
     def get_summary(self) -> Dict[str, any]:
-        """Get a comprehensive summary of all metrics."""
+        """Get a comprehensive summary of all metrics.
+
+        'errors_by_type' is a read-only view of the live counter; copy it
+        with dict() before mutating or storing it.
+        """
         return {
             'total_searches': self.total_searches,
             'successful_searches': self.successful_searches,
@@ -96,7 +104,7 @@ class SearchMetrics:
             'average_search_duration': round(self.get_average_search_duration(), 2),
             'searches_per_minute': round(self.get_searches_per_minute(), 2),
             'points_per_search': round(self.get_points_per_search(), 2),
-            'errors_by_type': dict(self.errors_by_type)
+            'errors_by_type': MappingProxyType(self.errors_by_type)
         }
 
 
@@ -106,7 +114,7 @@ class MetricsCollector:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.metrics = SearchMetrics()
-        self.metrics.start_time = time.time()
+        self.metrics.start_time = _now()
         self.logger.info("MetricsCollector initialized")
     
     def record_search_duration(self, duration_ms: float, points_gained: int = 0) -> None:
@@ -138,4 +146,4 @@ class MetricsCollector:
         """Reset all metrics for a new session."""
         self.logger.info("Resetting metrics")
         self.metrics = SearchMetrics()
-        self.metrics.start_time = time.time()
+        self.metrics.start_time = _now()
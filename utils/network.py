@@ -6,18 +6,59 @@ import logging
 def is_connected(host="8.8.8.8", port=53, timeout=3):
     """Check if the system has internet connectivity."""
     try:
-        socket.create_connection((host, port), timeout=timeout)
-        return True
+        # Close the probe socket right away instead of leaking one per call
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
     except (socket.timeout, socket.error):
         return False
 
-def wait_for_connection(retry_seconds=5, logger=None):
-    """Block until internet connectivity is available."""
+def _retry_delays(retry_seconds, max_retry_seconds, logger):
+    """Yield the wait before each re-probe, doubling up to max_retry_seconds.
+
+    Logs the connectivity warning as each delay is taken.
+    """
+    delay = retry_seconds
+    while True:
+        logger.warning(f"No internet connectivity detected. Retrying in {delay} seconds...")
+        yield delay
+        delay = min(delay * 2, max_retry_seconds)
+
+def wait_for_connection(retry_seconds=1, max_retry_seconds=60, logger=None):
+    """Block until internet connectivity is available.
+
+    The delay between probes starts at retry_seconds and doubles after each
+    failed probe, capped at max_retry_seconds.
+    """
     import time
     if logger is None:
         logger = logging.getLogger(__name__)
     
+    delays = _retry_delays(retry_seconds, max_retry_seconds, logger)
     while not is_connected():
-        logger.warning(f"No internet connectivity detected. Retrying in {retry_seconds} seconds...")
-        time.sleep(retry_seconds)
+        time.sleep(next(delays))
     logger.info("Internet connectivity restored.")
+
+async def wait_for_connection_async(retry_seconds=1, max_retry_seconds=60, logger=None, stop_event=None):
+    """Async variant of wait_for_connection that does not block the event loop.
+
+    Probes and stop_event waits run in the default executor. Returns True once
+    connected, or False if stop_event (a threading.Event) is set first.
+    """
+    import asyncio
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    loop = asyncio.get_running_loop()
+    delays = _retry_delays(retry_seconds, max_retry_seconds, logger)
+    waited = False
+    while not await loop.run_in_executor(None, is_connected):
+        delay = next(delays)
+        waited = True
+        if stop_event is None:
+            await asyncio.sleep(delay)
+        elif await loop.run_in_executor(None, stop_event.wait, delay):
+            logger.info("Stop requested while waiting for network; aborting wait.")
+            return False
+    if waited:
+        logger.info("Internet connectivity restored.")
+    return True
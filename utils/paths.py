@@ -1,10 +1,17 @@
 # utils/paths.py - Utility for managing app data and resource paths
 
+import functools
 import os
 import sys
 
+_app_data_dir = None
+
 def get_app_data_dir():
     """Return the app data directory, creating it if necessary."""
+    global _app_data_dir
+    if _app_data_dir is not None:
+        return _app_data_dir
+
     if sys.platform == 'win32':
         app_data = os.environ.get('APPDATA', os.path.expanduser('~\\AppData\\Roaming'))
     else:
@@ -12,8 +19,10 @@ def get_app_data_dir():
     
     app_dir = os.path.join(app_data, 'BingSearchAutomate-Headless')
     os.makedirs(app_dir, exist_ok=True)
+    _app_data_dir = app_dir
     return app_dir
 
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
     """Return the absolute path to a resource file."""
     if hasattr(sys, '_MEIPASS'):
@@ -3,15 +3,18 @@ Proxy rotation utilities for avoiding detection.
 Supports multiple proxy types and automatic rotation.
 """
 
+import functools
+import heapq
 import random
 import logging
 from typing import Optional, Dict, List
 from dataclasses import dataclass
+from urllib.parse import urlsplit, unquote
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProxyConfig:
     """Configuration for a single proxy."""
     server: str
@@ -19,14 +22,21 @@ class ProxyConfig:
     password: Optional[str] = None
     proxy_type: str = "http"  # http, https, socks5
     
-    def to_playwright_format(self) -> Dict[str, str]:
-        """Convert to Playwright proxy format."""
+    @functools.cached_property
+    def _playwright_proxy(self) -> Dict[str, str]:
         proxy_dict = {"server": self.server}
         if self.username and self.password:
             proxy_dict["username"] = self.username
             proxy_dict["password"] = self.password
         return proxy_dict
     
+    def to_playwright_format(self) -> Dict[str, str]:
+        """Convert to Playwright proxy format.
+        
+        The dict is built once per proxy and shared; copy it before mutating.
+        """
+        return self._playwright_proxy
+    
     def __str__(self) -> str:
         """String representation without exposing credentials."""
         if self.username:
@@ -48,11 +58,15 @@ class ProxyRotator:
         self.rotation_strategy = rotation_strategy
         self.current_index = 0
         self.usage_count = {}
+        # Min-heap of (usage_count, random tie-breaker, index) for least-used selection.
+        # Entries may lag behind usage_count; they are refreshed lazily when popped.
+        self._usage_heap = []
         self.logger = logging.getLogger(__name__)
         
         # Initialize usage tracking
         for i, proxy in enumerate(self.proxies):
             self.usage_count[i] = 0
+            heapq.heappush(self._usage_heap, (0, random.random(), i))
     
     def add_proxy(self, server: str, username: str = None, 
                   password: str = None, proxy_type: str = "http") -> None:
@@ -66,6 +80,7 @@ class ProxyRotator:
         idx = len(self.proxies)
         self.proxies.append(proxy)
         self.usage_count[idx] = 0
+        heapq.heappush(self._usage_heap, (0, random.random(), idx))
         self.logger.info(f"Added proxy to pool: {proxy}")
     
     def get_next_proxy(self) -> Optional[ProxyConfig]:
@@ -102,13 +117,16 @@ class ProxyRotator:
         if not self.proxies:
             return None
         
-        min_usage = min(self.usage_count.values())
-        least_used_indices = [idx for idx, count in self.usage_count.items() 
-                             if count == min_usage]
-        idx = random.choice(least_used_indices)
+        # Counts only grow, so a stale entry is re-pushed with its current count
+        while True:
+            count, _, idx = heapq.heappop(self._usage_heap)
+            if count == self.usage_count[idx]:
+                break
+            heapq.heappush(self._usage_heap, (self.usage_count[idx], random.random(), idx))
         
         proxy = self.proxies[idx]
         self.usage_count[idx] += 1
+        heapq.heappush(self._usage_heap, (self.usage_count[idx], random.random(), idx))
         self.logger.info(f"Selected least-used proxy: {proxy} "
                         f"(used {self.usage_count[idx]} times)")
         return proxy
@@ -134,23 +152,28 @@ class ProxyRotator:
         
         for proxy_str in proxy_list:
             try:
-                # Parse proxy string
-                if "://" in proxy_str:
-                    proxy_type, rest = proxy_str.split("://", 1)
-                else:
-                    proxy_type = "http"
-                    rest = proxy_str
+                # Parse proxy string (scheme defaults to http)
+                proxy_type, sep, rest = proxy_str.partition("://")
+                if not sep:
+                    proxy_type, rest = "http", proxy_str
                 
-                # Check for authentication
-                if "@" in rest:
-                    auth, server = rest.rsplit("@", 1)
-                    if ":" in auth:
-                        username, password = auth.split(":", 1)
-                    else:
-                        username, password = auth, None
+                # Split credentials off at the last '@' before urlsplit, so an
+                # unencoded '/', '?' or '#' in the password can't end the netloc early
+                auth, at, server = rest.rpartition("@")
+                if at:
+                    username, colon, password = auth.partition(":")
+                    username = unquote(username)
+                    password = unquote(password) if colon else None
                 else:
-                    server = rest
-                    username, password = None, None
+                    username = password = None
+                
+                # Validate host:port; netloc keeps IPv6 brackets intact
+                parts = urlsplit("//" + server)
+                if parts.path or parts.query or parts.fragment:
+                    raise ValueError(f"unexpected text after host:port in '{server}'")
+                if parts.hostname is None:
+                    raise ValueError(f"missing host in '{server}'")
+                _ = parts.port  # Raises ValueError on a non-numeric or out-of-range port
                 
                 rotator.add_proxy(server, username, password, proxy_type)
             except Exception as e:
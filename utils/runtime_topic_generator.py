@@ -3,12 +3,23 @@
 
 import random
 import logging
-from typing import Dict, Set, List, Optional
-from collections import deque
-from .topic_provider import TopicProvider
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from collections import OrderedDict
+from functools import reduce
+from itertools import accumulate
+from math import gcd
 
 
-class RuntimeTopicGenerator(TopicProvider):
+class RuntimeTopicStats(NamedTuple):
+    """Generation statistics returned by RuntimeTopicGenerator.get_statistics()."""
+    generated_count: int
+    unique_topics: int
+    generator_type: str
+    cache_enabled: bool
+    max_cache_size: int
+
+
+class RuntimeTopicGenerator:
     """Generate diverse search topics dynamically at runtime.
     
     Uses template-based generation with random combinations to create
@@ -23,67 +34,86 @@ class RuntimeTopicGenerator(TopicProvider):
     
     # Expandable noun categories
     NOUNS = {
-        'animals': [
+        'animals': (
             'dog', 'cat', 'elephant', 'dolphin', 'whale', 'chimpanzee',
             'parrot', 'eagle', 'penguin', 'lion', 'tiger', 'bear',
             'wolf', 'fox', 'deer', 'monkey', 'panda', 'koala',
             'octopus', 'butterfly', 'bee', 'ant', 'spider', 'shark',
             'crocodile', 'snake', 'alligator', 'zebra', 'horse'
-        ],
-        'tech': [
+        ),
+        'tech': (
             'AI', 'machine learning', 'blockchain', 'quantum computing',
             'cloud storage', 'API', 'microservices', 'containerization',
             'cybersecurity', 'encryption', 'virtual reality', 'IoT',
             '5G', 'web3', 'neural networks', 'database', 'algorithm',
             'programming', 'software architecture', 'DevOps'
-        ],
-        'science': [
+        ),
+        'science': (
             'DNA', 'photosynthesis', 'cell division', 'mutation', 'evolution',
             'gravity', 'quantum mechanics', 'relativity', 'atom', 'molecule',
             'chemical reaction', 'thermodynamics', 'physics', 'biology',
             'chemistry', 'ecology', 'ecosystem', 'extinction'
-        ],
-        'history': [
+        ),
+        'history': (
             'ancient Rome', 'medieval period', 'Renaissance', 'Industrial Revolution',
             'World War II', 'Cold War', 'Roman Empire', 'Egyptian civilization',
             'Greek philosophy', 'Victorian era', 'American Revolution'
-        ],
-        'geography': [
+        ),
+        'geography': (
             'Amazon rainforest', 'Mount Everest', 'Sahara desert', 'Arctic',
             'Antarctic', 'Great Barrier Reef', 'Grand Canyon', 'Nile River',
             'Himalayas', 'oceans', 'volcanoes', 'tectonic plates'
-        ],
-        'business': [
+        ),
+        'business': (
             'startup', 'marketing strategy', 'financial planning', 'investment',
             'entrepreneurship', 'management', 'negotiation', 'branding',
             'sales technique', 'supply chain', 'customer service'
-        ]
+        )
     }
     
-    ADJECTIVES = [
+    ADJECTIVES = (
         'endangered', 'ancient', 'rare', 'modern', 'advanced', 'basic',
         'mysterious', 'fascinating', 'dangerous', 'harmless', 'intelligent',
         'unique', 'remarkable', 'unusual', 'common', 'extinct', 'evolving',
         'revolutionary', 'controversial', 'natural', 'artificial'
-    ]
+    )
     
-    ACTIVITIES = [
+    ACTIVITIES = (
         'communication', 'migration', 'hunting', 'mating', 'behavior',
         'development', 'adaptation', 'reproduction', 'social structure',
         'feeding habits', 'camouflage', 'survival', 'intelligence',
         'tool use', 'learning', 'memory', 'cooperation'
-    ]
+    )
     
-    VERBS = [
+    VERBS = (
         'explained', 'tutorial', 'guide', 'analysis', 'overview',
         'best practices', 'tips and tricks', 'for beginners',
         'advanced strategies', 'comparison', 'advantages', 'disadvantages'
-    ]
+    )
     
-    CONTEXTS = [
+    CONTEXTS = (
         '2024', 'in 2025', 'future predictions', 'history of',
         'impact on society', 'recent developments', 'latest research'
-    ]
+    )
+    
+    # Flattened word pools, built once at class creation
+    _ALL_NOUNS = tuple(n for cat in NOUNS.values() for n in cat)
+    
+    # Number of distinct word combinations for each template (same order as _generate_topic)
+    _TEMPLATE_SIZES = (
+        len(ADJECTIVES) * len(_ALL_NOUNS),
+        len(_ALL_NOUNS) * len(ACTIVITIES),
+        len(_ALL_NOUNS) * len(ACTIVITIES) * len(VERBS),
+        len(ADJECTIVES) * len(_ALL_NOUNS) * len(VERBS),
+        len(_ALL_NOUNS) * len(VERBS) * len(CONTEXTS),
+    )
+    # A single draw below _DRAW_SPACE picks both the template (draw % 5) and a
+    # combination index ((draw // 5) % size); the lcm keeps both exactly uniform
+    _DRAW_SPACE = len(_TEMPLATE_SIZES) * reduce(lambda a, b: a * b // gcd(a, b), _TEMPLATE_SIZES)
+    # Start of each template's range in the combined topic key space
+    _TEMPLATE_OFFSETS = tuple(accumulate(_TEMPLATE_SIZES[:-1], initial=0))
+    # Fresh draws tried on a cache hit before the duplicate is used as-is
+    _MAX_REDRAWS = 2
     
     def __init__(self, config: Optional[Dict] = None, topics_logger=None):
         """Initialize the runtime topic generator.
@@ -91,91 +121,144 @@ class RuntimeTopicGenerator(TopicProvider):
         Args:
             config (dict, optional): Configuration dictionary with options like:
                 - 'cache_duplicates': Whether to track and avoid duplicate topics
-                - 'max_generation_attempts': Max attempts to avoid duplicates
                 - 'max_cache_size': Maximum number of topics to cache (default: 1000)
+                - 'seed': Optional seed for the generator's random number source
             topics_logger (logger, optional): Logger instance for recording search topics
         """
         self.logger = logging.getLogger(__name__)
         self.topics_logger = topics_logger
         self.config = config or {}
         
-        self.generated_topics: Set[str] = set()
+        # Integer keys of cached topics (see _generate_topic); insertion order
+        # doubles as the LRU eviction queue
+        self._seen_keys: "OrderedDict[int, None]" = OrderedDict()
         self.generation_count: int = 0
-        self.topic_order: deque = deque()  # Track insertion order for LRU eviction
         
         self.cache_duplicates: bool = self.config.get('cache_duplicates', True)
-        self.max_generation_attempts: int = self.config.get('max_generation_attempts', 10)
         self.max_cache_size: int = self.config.get('max_cache_size', 1000)
+        # Cached once (refreshed on reset) so per-topic debug messages cost nothing when disabled
+        self._debug_enabled: bool = self.logger.isEnabledFor(logging.DEBUG)
+        # Per-instance RNG; an optional 'seed' makes the topic sequence reproducible
+        self._rng = random.Random(self.config.get('seed'))
+        self._randrange = self._rng.randrange
         
         self.logger.info(
             f"RuntimeTopicGenerator initialized (cache_duplicates={self.cache_duplicates}, "
             f"max_cache_size={self.max_cache_size})"
         )
     
+    def _generate_topic(self) -> Tuple[str, int]:
+        """Generate a single random topic (no duplicate handling).
+        
+        Returns:
+            tuple: (topic, key) where key is a non-negative int that uniquely
+                identifies the word combination, used for duplicate tracking
+        """
+        r = self._randrange
+        nouns = self._ALL_NOUNS
+        adjectives = self.ADJECTIVES
+        activities = self.ACTIVITIES
+        verbs = self.VERBS
+        contexts = self.CONTEXTS
+        
+        # One draw selects the template and an index into its whole
+        # word-combination space; divmod splits that into per-word indices
+        k, template_id = divmod(r(self._DRAW_SPACE), 5)
+        k %= self._TEMPLATE_SIZES[template_id]
+        key = self._TEMPLATE_OFFSETS[template_id] + k
+        if template_id == 0:
+            i, j = divmod(k, len(nouns))
+            return f"{adjectives[i]} {nouns[j]}", key
+        elif template_id == 1:
+            i, j = divmod(k, len(activities))
+            return f"{nouns[i]} {activities[j]}", key
+        elif template_id == 2:
+            k, j = divmod(k, len(verbs))
+            i, h = divmod(k, len(activities))
+            return f"{nouns[i]} {activities[h]} {verbs[j]}", key
+        elif template_id == 3:
+            k, j = divmod(k, len(verbs))
+            i, h = divmod(k, len(nouns))
+            return f"{adjectives[i]} {nouns[h]} {verbs[j]}", key
+        else:
+            k, j = divmod(k, len(contexts))
+            i, h = divmod(k, len(verbs))
+            return f"{nouns[i]} {verbs[h]} {contexts[j]}", key
+    
     def get_next_topic(self) -> str:
         """Generate and return the next search topic.
         
         Returns random combination of words to create natural-sounding search queries.
-        If cache_duplicates is enabled, attempts to avoid returning same topic twice.
+        If cache_duplicates is enabled, never returns a topic that is still cached.
         
         Returns:
             str: A dynamically generated search topic
         """
+        return self.get_next_topics(1)[0]
+    
+    def get_next_topics(self, n: int) -> List[str]:
+        """Generate and return the next n search topics in one batch.
         
-        def _generate() -> str:
-            """Internal function to generate a single topic"""
-            # Randomly select from templates
-            noun_category = random.choice(list(self.NOUNS.keys()))
-            noun = random.choice(self.NOUNS[noun_category])
-            adjective = random.choice(self.ADJECTIVES)
-            
-            # Randomly choose generation template
-            template = random.choice([
-                f"{adjective} {noun}",
-                f"{noun} {random.choice(self.ACTIVITIES)}",
-                f"{noun} {random.choice(self.ACTIVITIES)} {random.choice(self.VERBS)}",
-                f"{adjective} {noun} {random.choice(self.VERBS)}",
-                f"{noun} {random.choice(self.VERBS)} {random.choice(self.CONTEXTS)}"
-            ])
-            
-            return template.strip()
-        
-        # Generate topic, avoiding duplicates if caching enabled
-        topic = _generate()
-        attempts = 0
+        Equivalent to calling get_next_topic() n times, but the per-call
+        setup is done once for the whole batch.
         
-        while self.cache_duplicates and topic in self.generated_topics and attempts < self.max_generation_attempts:
-            topic = _generate()
-            attempts += 1
+        Args:
+            n (int): Number of topics to generate
         
-        if attempts >= self.max_generation_attempts:
-            self.logger.debug(f"Max generation attempts reached, using duplicate topic: {topic}")
+        Returns:
+            list: The generated topics, in order
+        """
+        generate = self._generate_topic
+        cache_duplicates = self.cache_duplicates
+        seen = self._seen_keys
+        max_cache_size = self.max_cache_size
+        debug_enabled = self._debug_enabled
+        topics_logger = self.topics_logger
+        max_redraws = self._MAX_REDRAWS
+        count = self.generation_count
+        topics = []
         
-        # Add to cache with LRU eviction if needed
-        if topic not in self.generated_topics:
-            self.generated_topics.add(topic)
-            self.topic_order.append(topic)
+        for _ in range(n):
+            # Generate topic; on a cache hit redraw a bounded number of times,
+            # so the cost stays O(1) however full the cache is
+            topic, key = generate()
+            if cache_duplicates and key in seen:
+                for _ in range(max_redraws):
+                    topic, key = generate()
+                    if key not in seen:
+                        break
+                else:
+                    if debug_enabled:
+                        self.logger.debug(f"Max redraws reached, using duplicate topic: {topic}")
             
-            # LRU eviction: Remove oldest topic if cache is full
-            if len(self.generated_topics) > self.max_cache_size:
-                oldest_topic = self.topic_order.popleft()
-                self.generated_topics.discard(oldest_topic)
-                self.logger.debug(
-                    f"Cache limit reached ({self.max_cache_size}), evicted oldest topic: {oldest_topic}"
-                )
-        
-        self.generation_count += 1
-        
-        self.logger.debug(f"Generated topic #{self.generation_count}: {topic}")
-        
-        # Log to topics.log if logger is available (runtime mode)
-        if self.topics_logger:
-            try:
-                self.topics_logger.info(topic)
-            except Exception as e:
-                self.logger.error(f"Failed to log topic to topics.log: {e}")
+            # Add to cache with LRU eviction if needed
+            if key not in seen:
+                seen[key] = None
+                
+                # LRU eviction: Remove oldest topic if cache is full
+                if len(seen) > max_cache_size:
+                    oldest_key, _ = seen.popitem(last=False)
+                    if debug_enabled:
+                        self.logger.debug(
+                            f"Cache limit reached ({max_cache_size}), evicted oldest topic key: {oldest_key}"
+                        )
+            
+            count += 1
+            
+            if debug_enabled:
+                self.logger.debug(f"Generated topic #{count}: {topic}")
+            
+            # Log to topics.log if logger is available (runtime mode)
+            if topics_logger:
+                try:
+                    topics_logger.info(topic)
+                except Exception as e:
+                    self.logger.error(f"Failed to log topic to topics.log: {e}")
+            
+            topics.append(topic)
         
-        return topic
+        self.generation_count = count
+        return topics
     
     def reset(self) -> None:
         """Reset provider state for a new search session.
@@ -185,20 +268,21 @@ class RuntimeTopicGenerator(TopicProvider):
         self.logger.info(
             f"RuntimeTopicGenerator reset (generated {self.generation_count} unique topics)"
         )
-        self.generated_topics.clear()
-        self.topic_order.clear()
+        self._seen_keys.clear()
         self.generation_count = 0
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
     
-    def get_statistics(self) -> Dict[str, any]:
+    def get_statistics(self) -> RuntimeTopicStats:
         """Get generation statistics.
         
         Returns:
-            dict: Statistics including generated_count, unique_topics
+            RuntimeTopicStats: Statistics including generated_count, unique_topics
+                (use ``._asdict()`` for a plain dict)
         """
-        return {
-            'generated_count': self.generation_count,
-            'unique_topics': len(self.generated_topics),
-            'generator_type': 'RuntimeTopicGenerator',
-            'cache_enabled': self.cache_duplicates,
-            'max_cache_size': self.max_cache_size
-        }
+        return RuntimeTopicStats(
+            self.generation_count,
+            len(self._seen_keys),
+            'RuntimeTopicGenerator',
+            self.cache_duplicates,
+            self.max_cache_size
+        )
@@ -1,36 +1,37 @@
 # utils/topic_provider.py
-"""Abstract interface for topic generation strategies"""
+"""Structural interface for topic generation strategies"""
 
-from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Any, Protocol, Tuple
 
 
-class TopicProvider(ABC):
-    """Abstract base class for all topic generation strategies"""
+class TopicProvider(Protocol):
+    """Interface for all topic generation strategies.
+    
+    Providers satisfy it structurally by implementing these methods; they do
+    not need to inherit from it.
+    """
     
-    @abstractmethod
     def get_next_topic(self) -> str:
         """Return the next search topic.
         
         Returns:
             str: A search term/topic to use
         """
-        pass
+        ...
     
-    @abstractmethod
     def reset(self):
         """Reset provider state for a new search session.
         
         Called when starting a new search cycle to clear any generated topics
         or reset internal counters.
         """
-        pass
+        ...
     
-    @abstractmethod
-    def get_statistics(self) -> Dict[str, int]:
+    def get_statistics(self) -> Tuple[Any, ...]:
         """Get provider statistics for debugging.
         
         Returns:
-            dict: Statistics about topic generation (generated_count, unique_topics, etc.)
+            NamedTuple: Statistics about topic generation (generator_type plus
+                provider-specific fields); use ``._asdict()`` for a plain dict
         """
-        pass
+        ...